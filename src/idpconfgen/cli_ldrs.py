@@ -1093,7 +1093,7 @@ def main(
         
         files_to_process = []
         if MULTICHAIN:
-            files_to_process = inter_chain_cc(all_files, nconfs)
+            files_to_process = inter_chain_cc(all_files, nconfs, ncores)
         else:
             for i in range(len(list(all_files.values())[0])):
                 new_dict = {}
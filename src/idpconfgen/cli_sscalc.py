@@ -26,11 +26,11 @@ from idpconfgen.cli_dssppii import dssp_ppii_assignment
 from idpconfgen.components.plots.plotfuncs import plot_fracSS
 from idpconfgen.libs import libcli
 from idpconfgen.libs.libio import (
+    PairSaver,
     extract_from_tar,
     read_dictionary_from_disk,
     read_path_bundle,
     save_dictionary,
-    save_pairs_to_disk,
     )
 from idpconfgen.libs.libmulticore import (
     consume_iterable_in_list,
@@ -42,6 +42,7 @@ from idpconfgen.logger import S, T, init_files, report_on_crash
 
 LOGFILESNAME = '.idpconfgen_sscalc'
 TMPDIR = '__tmpsscalc__'
+SAVE_BATCH = 256
 
 _name = 'sscalc'
 _help = 'Calculate secondary structure profile.'
@@ -189,6 +190,9 @@ def main(
 
     log.info(T('preparing task execution'))
 
+    # opened once for the whole run; reopening a tar destination per
+    # batch rewrites the archive trailer every time
+    pair_saver = PairSaver(destination)
     try:
         consume_func = partial(
             consume_iterable_in_list,
@@ -222,10 +226,15 @@ def main(
                     assert fname not in dssp_data
                     dssp_data[fname] = dsspdict
 
-                    # notice the copy, this is needed for the .clear()
-                    # to work later on
                     pdb_data[f'{fname}.pdb'] = pdb_split
-            save_pairs_to_disk(pdb_data.items(), destination=destination)
+                    # stream split PDBs to disk in small batches so
+                    # memory stays bounded by the batch, not the chunk,
+                    # and writes overlap with the DSSP computation
+                    if len(pdb_data) >= SAVE_BATCH:
+                        pair_saver.save(pdb_data.items())
+                        pdb_data.clear()
+        if pdb_data:
+            pair_saver.save(pdb_data.items())
             pdb_data.clear()  # clears the dictionary to release memory
 
     except Exception as err:
@@ -234,6 +243,7 @@ def main(
         raise err
 
     finally:
+        pair_saver.close()
         if _istarfile:
             shutil.rmtree(tmpdir)
 
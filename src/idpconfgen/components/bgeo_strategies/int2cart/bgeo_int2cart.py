@@ -41,17 +41,21 @@ class BGEO_Int2Cart:
         model_state = _['model_state_dict']
 
         builder.load_predictor_weights(model_state)
+        # inference only: disable dropout/batch-norm updates
+        builder.eval()
         self.builder = builder
 
     def get_internal_coords(self, sequence, torsions):
         """Get internal coords."""
-        predictions = predict(
-            self.builder,
-            sequence,
-            torsions,
-            build=False,
-            units="radian",
-            )
+        # inference_mode skips autograd bookkeeping on every call
+        with torch.inference_mode():
+            predictions = predict(
+                self.builder,
+                sequence,
+                torsions,
+                build=False,
+                units="radian",
+                )
         d1 = predictions['d1'][0, -1, 0]
         d2 = predictions['d2'][0, -1, 0]
         d3 = predictions['d3'][0, -1, 0]
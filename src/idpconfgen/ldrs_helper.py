@@ -5,11 +5,15 @@ Methodology deviates from traditional IDP or beads-on-a-string FLDR/S approach.
 
 Name: FLDR/S (Folded disordered region/structure sampling)
 """
+import math
 import os
 import random
 from itertools import combinations, product
 
 import numpy as np
+from numba import njit
+from scipy.spatial import cKDTree
+from scipy.spatial.distance import cdist
 
 from idpconfgen import Path
 from idpconfgen.core.definitions import (
@@ -45,6 +49,39 @@ disorder_cases = {
     2: "C-IDR",
     }
 
+# Merged radii used by `count_clashes`, built once at import time
+all_vdw_radii = {**vdW_radii_tsai_1999, **vdW_radii_ionic_CRC82}
+
+# Above this many cells, the full distance matrix in `count_clashes`
+# is replaced by a KD-tree neighbor search to bound memory
+clash_matrix_max_cells = 4_000_000
+
+
+def vdw_radii_lookup(elements):
+    """
+    Convert an array of element symbols to their vdW radii.
+
+    Performs one dictionary lookup per unique element only and gathers
+    the full-length radius array with a single vectorized indexing
+    operation.
+
+    Parameters
+    ----------
+    elements : np.ndarray
+        Array of element symbols as found in the PDB element column.
+
+    Return
+    ------
+    np.ndarray of np.float64 radii, same length as `elements`.
+    """
+    unique, inverse = np.unique(elements, return_inverse=True)
+    lut = np.fromiter(
+        (all_vdw_radii[e] for e in unique),
+        dtype=np.float64,
+        count=len(unique),
+        )
+    return lut[inverse]
+
 
 def tolerance_calculator(tolerance):
     """
@@ -87,7 +124,12 @@ def calculate_distance(coords1, coords2):
     ------
     float distance
     """
-    return np.sqrt(np.sum((coords1 - coords2) ** 2))
+    # scalar math beats three chained NumPy ufunc dispatches
+    # for a single 3D distance
+    dx = coords1[0] - coords2[0]
+    dy = coords1[1] - coords2[1]
+    dz = coords1[2] - coords2[2]
+    return math.sqrt(dx * dx + dy * dy + dz * dz)
 
 
 def calculate_angle(a, b, c):
@@ -124,38 +166,99 @@ def calculate_angle(a, b, c):
     return angle
 
 
+@njit
+def consecutive_grouper_njit(seq):
+    """
+    Find boundaries of consecutive runs in an int64 array.
+
+    Parameters
+    ----------
+    seq : np.ndarray of np.int64
+        Sorted indices of disordered residues.
+
+    Return
+    ------
+    bounds : np.ndarray of shape (n, 2)
+        One (first, last + 1) row per consecutive run.
+    """
+    n = seq.shape[0]
+    bounds = np.empty((n, 2), dtype=np.int64)
+    count = 0
+    start = seq[0]
+    prev = seq[0]
+    for i in range(1, n):
+        x = seq[i]
+        if x != prev + 1:
+            bounds[count, 0] = start
+            bounds[count, 1] = prev + 1
+            count += 1
+            start = x
+        prev = x
+    bounds[count, 0] = start
+    bounds[count, 1] = prev + 1
+    count += 1
+    return bounds[:count]
+
+
 def consecutive_grouper(seq):
     """
-    Use negative indexing to group together consecutive numbers.
+    Group together consecutive numbers.
+
+    The tight integer loop is JIT compiled in
+    `consecutive_grouper_njit`; this wrapper keeps the list-of-tuples
+    interface the callers expect.
 
-    Reference
-    ---------
-    https://stackoverflow.com/questions/70363072/group-together-consecutive-numbers-in-a-list
-    
     Parameters
     ----------
-    seq : string
+    seq : sequence of int
         Special sequence where indices of disordered residues are stored.
-    
+
     Return
     ------
     bounds : list
         List of ranges for boundaries of disordered sequences.
     """
-    grouped = [[seq[0]]]
-    for x in seq[1:]:
-        if x == grouped[-1][-1] + 1:
-            grouped[-1].append(x)
-        else:
-            grouped.append([x])
-            
-    bounds = []
-    for group in grouped:
-        first = group[0]
-        last = group[len(group) - 1]
-        bounds.append((first, last + 1))
-    
-    return bounds
+    seq_arr = np.asarray(seq, dtype=np.int64)
+    if seq_arr.shape[0] == 0:
+        # keep the baseline IndexError; inside the nopython kernel an
+        # empty array would be read past its buffer instead
+        raise IndexError('`seq` is empty, no boundaries to group.')
+    bounds_arr = consecutive_grouper_njit(seq_arr)
+    return [(int(first), int(last)) for first, last in bounds_arr]
+
+
+# Per-process cache of built Structures keyed by file path, so repeated
+# clash checks over the same IDR conformer do not re-parse the PDB
+_structure_cache = {}
+_structure_cache_maxsize = 32
+
+
+def build_structure_cached(fpath):
+    """
+    Build a Structure once per file within a worker process.
+
+    Repeated requests for the same path return the already built
+    Structure instead of re-parsing the PDB from disk.
+
+    Parameters
+    ----------
+    fpath : str or Path
+        Path to the structure file.
+
+    Return
+    ------
+    :class:`idpconfgen.libs.libstructure.Structure`, already built.
+    """
+    key = str(fpath)
+    try:
+        return _structure_cache[key]
+    except KeyError:
+        struc = Structure(Path(fpath))
+        struc.build()
+        if len(_structure_cache) >= _structure_cache_maxsize:
+            _structure_cache.pop(next(iter(_structure_cache)))
+        _structure_cache[key] = struc
+        return struc
 
 
 def combinations_clash_check(selected):
@@ -173,13 +276,11 @@ def combinations_clash_check(selected):
         second = selected[1]
         # [L-IDR, C-IDR] case
         if type(first) is tuple:
-            second_struc = Structure(second)
-            second_struc.build()
+            second_struc = build_structure_cached(second)
             if len(first) > 1:
                 # Check all L-IDR against C-IDR
                 for l in first:    # noqa: E741
-                    l_struc = Structure(l)
-                    l_struc.build()
+                    l_struc = build_structure_cached(l)
                     l_arr = l_struc.data_array
                     l_c, _ = count_clashes(l_arr, second_struc, tolerance=1.0)
                     if type(l_c) is bool:
@@ -187,29 +288,25 @@ def combinations_clash_check(selected):
                 l_combos = list(combinations(first, 2))
                 # Check all L-IDR against each other
                 for combo in l_combos:
-                    l1 = Structure(combo[0])
-                    l1.build()
-                    l2 = Structure(combo[1])
-                    l2.build()
+                    l1 = build_structure_cached(combo[0])
+                    l2 = build_structure_cached(combo[1])
                     lx2, _ = count_clashes(l1.data_array, l2, tolerance=1.0)
                     if type(lx2) is bool:
                         return False
             else:
                 lidr = first[0]
-                lidr_struc = Structure(lidr)
+                lidr_struc = build_structure_cached(lidr)
                 lidr_arr = lidr_struc.data_array
                 l_c, _ = count_clashes(lidr_arr, second_struc, tolerance=1.0)
                 if type(l_c) is bool:
                     return False
         # [N-IDR, L-IDR] case
         elif type(second) is tuple:
-            first_struc = Structure(second)
-            first_struc.build()
+            first_struc = build_structure_cached(second)
             if len(second) > 1:
                 # Check all L-IDR against N-IDR
                 for l in second:    # noqa: E741
-                    l_struc = Structure(l)
-                    l_struc.build()
+                    l_struc = build_structure_cached(l)
                     l_arr = l_struc.data_array
                     n_l, _ = count_clashes(l_arr, first_struc, tolerance=1.0)
                     if type(n_l) is bool:
@@ -217,45 +314,38 @@ def combinations_clash_check(selected):
                 l_combos = list(combinations(second, 2))
                 # Check all L-IDR against each other
                 for combo in l_combos:
-                    l1 = Structure(combo[0])
-                    l1.build()
-                    l2 = Structure(combo[1])
-                    l2.build()
+                    l1 = build_structure_cached(combo[0])
+                    l2 = build_structure_cached(combo[1])
                     lx2, _ = count_clashes(l1.data_array, l2, tolerance=1.0)
                     if type(lx2) is bool:
                         return False
             else:
                 lidr = second[0]
-                lidr_struc = Structure(lidr)
+                lidr_struc = build_structure_cached(lidr)
                 lidr_arr = lidr_struc.data_array
                 n_l, _ = count_clashes(lidr_arr, first_struc, tolerance=1.0)
                 if type(n_l) is bool:
                     return False
         # [N-IDR, C-IDR] case
         elif type(first) is Path and type(second) is Path:
-            first_struc = Structure(first)
-            first_struc.build()
+            first_struc = build_structure_cached(first)
             first_arr = first_struc.data_array
-            second_struc = Structure(second)
-            second_struc.build()
+            second_struc = build_structure_cached(second)
             n_c, _ = count_clashes(first_arr, second_struc, tolerance=1.0)
             if type(n_c) is bool:
                 return False
     # [N-IDR, L-IDR, C-IDR] case
     elif len(selected) == 3:
         nidr = selected[0]
-        nidr_struc = Structure(nidr)
-        nidr_struc.build()
+        nidr_struc = build_structure_cached(nidr)
         cidr = selected[2]
-        cidr_struc = Structure(cidr)
-        cidr_struc.build()
+        cidr_struc = build_structure_cached(cidr)
         
         lidr = selected[1]
         if len(lidr) > 1:
             # Check all L-IDR against N-IDR and C-IDR
             for l in lidr:    # noqa: E741
-                l_struc = Structure(l)
-                l_struc.build()
+                l_struc = build_structure_cached(l)
                 l_arr = l_struc.data_array
                 n_l, _ = count_clashes(l_arr, nidr_struc, tolerance=1.0)
                 l_c, _ = count_clashes(l_arr, cidr_struc, tolerance=1.0)
@@ -264,17 +354,14 @@ def combinations_clash_check(selected):
             l_combos = list(combinations(lidr, 2))
             # Check all L-IDR against each other
             for combo in l_combos:
-                l1 = Structure(combo[0])
-                l1.build()
-                l2 = Structure(combo[1])
-                l2.build()
+                l1 = build_structure_cached(combo[0])
+                l2 = build_structure_cached(combo[1])
                 lx2, _ = count_clashes(l1.data_array, l2, tolerance=1.0)
                 if type(lx2) is bool:
                     return False
         # We just have 1 L-IDR
         else:
-            lidr_struc = Structure(lidr[0])
-            lidr_struc.build()
+            lidr_struc = build_structure_cached(lidr[0])
             lidr_arr = lidr_struc.data_array
             nidr_arr = nidr_struc.data_array
             n_i, _ = count_clashes(nidr_arr, lidr_struc, tolerance=1.0)
@@ -287,6 +374,43 @@ def combinations_clash_check(selected):
     return selected
 
 
+def sample_combinations(lst, num_combinations):
+    """
+    Sample unique combinations without materializing the product.
+
+    Draws combination indices from the lazy cartesian space of `lst`
+    and decodes each index into its element tuple, so memory stays
+    O(num_combinations) instead of the full product size.
+
+    Parameters
+    ----------
+    lst : list of list
+        Lists to combine, one element taken from each.
+
+    num_combinations : int
+        Number of combinations to sample. Capped at the product size.
+
+    Return
+    ------
+    selected : list of tuple
+        Unique combinations, one element from each list of `lst`.
+    """
+    sizes = [len(sublst) for sublst in lst]
+    total = math.prod(sizes)
+    picks = random.sample(range(total), min(num_combinations, total))
+
+    selected = []
+    for idx in picks:
+        combo = []
+        # decode the index in mixed radix, last list varying fastest
+        for sublst, size in zip(reversed(lst), reversed(sizes)):
+            idx, rem = divmod(idx, size)
+            combo.append(sublst[rem])
+        selected.append(tuple(reversed(combo)))
+
+    return selected
+
+
 def create_combinations(lst, num_combinations, ncores=1):
     """
     Create unique combinations between list of lists.
@@ -314,12 +438,8 @@ def create_combinations(lst, num_combinations, ncores=1):
         List of lists of different combinations as follows:
         [[item from list 1, item from list 2], ...]
     """
-    all_combinations = list(product(*lst))
-    max_combinations = len(all_combinations)
+    selected_combinations = sample_combinations(lst, num_combinations)
 
-    selected_combinations = \
-        random.sample(all_combinations, min(num_combinations, max_combinations))  # noqa: E501
-    
     if len(lst) == 1:
         return convert_tuples_to_lists(selected_combinations)
     else:
@@ -331,7 +451,7 @@ def create_combinations(lst, num_combinations, ncores=1):
         
         while len(passed) < num_combinations:
             selected_combinations = \
-                random.sample(all_combinations, min(num_combinations, max_combinations))  # noqa: E501
+                sample_combinations(lst, num_combinations)
             execute_clash = pool_function(combinations_clash_check, selected_combinations, ncores=ncores)  # noqa: E501
             for result in execute_clash:
                 if result is not False:
@@ -347,6 +467,30 @@ def create_combinations(lst, num_combinations, ncores=1):
         return convert_tuples_to_lists(passed)
 
 
+def scan_conformer_paths(fpath):
+    """
+    List conformer paths in a folder with a single scandir pass.
+
+    Replaces the isdir() check plus listdir() plus per-entry joinpath()
+    triple, which costs an extra stat() syscall per folder and a Path
+    allocation per entry. A missing folder yields an empty list.
+
+    Parameters
+    ----------
+    fpath : str or Path
+        Folder to enumerate.
+
+    Return
+    ------
+    list of Path objects, one per directory entry.
+    """
+    try:
+        with os.scandir(fpath) as entries:
+            return [Path(entry.path) for entry in entries]
+    except FileNotFoundError:
+        return []
+
+
 def create_all_combinations(folder, chains, nconfs, ncores=1):
     """
     Generate combinations of all cases.
@@ -379,25 +523,17 @@ def create_all_combinations(folder, chains, nconfs, ncores=1):
         nidr_path = chain_path.joinpath(disorder_cases[0])
         lidr_path = chain_path.joinpath(disorder_cases[1])
         cidr_path = chain_path.joinpath(disorder_cases[2])
-        nidr_files = []
         lidr_combinations = []
-        cidr_files = []
 
-        if os.path.isdir(nidr_path):
-            nidr_confs = os.listdir(nidr_path)
-            nidr_files = [Path(nidr_path.joinpath(cpath)) for cpath in nidr_confs]  # noqa: E501
+        nidr_files = scan_conformer_paths(nidr_path)
         if os.path.isdir(lidr_path):
             lidr_cases_dir = os.listdir(lidr_path)
             lidr_confs_lst = []
             for i, cpath in enumerate(lidr_cases_dir):
                 lidr_matches = lidr_path.joinpath(cpath + f"/{i}_match")
-                lidr_confs = os.listdir(lidr_matches)
-                lidr_files = [Path(lidr_matches.joinpath(fpath)) for fpath in lidr_confs]  # noqa: E501
-                lidr_confs_lst.append(lidr_files)
+                lidr_confs_lst.append(scan_conformer_paths(lidr_matches))
             lidr_combinations = create_combinations(lidr_confs_lst, nconfs)
-        if os.path.isdir(cidr_path):
-            cidr_confs = os.listdir(cidr_path)
-            cidr_files = [Path(cidr_path.joinpath(cpath)) for cpath in cidr_confs]  # noqa: E501
+        cidr_files = scan_conformer_paths(cidr_path)
 
         if len(nidr_files) and len(cidr_files) and len(lidr_combinations) > 0:
             combinations[c] = create_combinations([nidr_files, lidr_combinations, cidr_files], nconfs, ncores)  # noqa: E501
@@ -468,27 +604,29 @@ def break_check(fdata, membrane=False):
     ca = coords_raw[ca_mask, :]
     c = coords_raw[c_mask, :]
 
-    try:
-        coords = np.empty((n.shape[0] * 3, 3), dtype=np.float64)
-        coords[0::3, :] = n
-        coords[1::3, :] = ca
-        coords[2::3, :] = c
-    except ValueError as err:
+    if not n.shape == ca.shape == c.shape:
         errmsg = (
             'Coordinates do not match expectation. '
             'Some possibly missing.'
             )
-        raise IDPConfGenException(errmsg) from err
+        raise IDPConfGenException(errmsg)
+
+    # Compute the three backbone bond distances directly from the
+    # per-atom-name arrays instead of interleaving all coordinates into
+    # a (3N, 3) array and recomputing consecutive differences.
+    d_nca = np.linalg.norm(ca - n, axis=1)
+    d_cac = np.linalg.norm(c - ca, axis=1)
+    d_cn = np.linalg.norm(n[1:, :] - c[:-1, :], axis=1)
+
+    # Interleaved as [N-CA, CA-C, C-N', ...] to keep the downstream
+    # index arithmetic identical to the previous implementation
+    coords_distances = np.empty(n.shape[0] * 3 - 1, dtype=np.float64)
+    coords_distances[0::3] = d_nca
+    coords_distances[1::3] = d_cac
+    coords_distances[2::3] = d_cn
 
-    coords_distances = np.linalg.norm(coords[:-1, :] - coords[1:, :], axis=1)
-    assert coords_distances.size == coords.shape[0] - 1
-    
     if np.any(coords_distances > 2.1):
-        whole = []
-        for i, dist in enumerate(coords_distances):
-            if dist < 2.1:
-                whole.append(i)
-        
+        whole = np.where(coords_distances < 2.1)[0].tolist()
         whole = consecutive_grouper(whole)
         fld_seqs = []
         for idx in whole:
@@ -550,35 +688,28 @@ def align_coords(sample, target, case):
 
     idr_term_idx = {}
 
+    # Boundary atoms are found with vectorized masks on the integer
+    # resSeq array instead of per-atom Python scans
     if case == disorder_cases[0]:  # N-IDR
-        # In the case of N-IDR, we want to move relative to C-term
-        for i, _atom in enumerate(atom_names):
-            # Use last residues of N-IDR for alignment
-            j = len(atom_names) - 1 - i
-            seq = res_seq[j]
-
-            if seq == last_seq and atom_names[j] == "N":
-                idr_term_idx["N"] = j
-            elif seq == last_seq and atom_names[j] == "CA":
-                idr_term_idx["CA"] = j
-            elif seq == last_seq - 1 and atom_names[j] == "C":
-                idr_term_idx["C"] = j
-            elif seq == last_seq - 2:
-                break
+        # In the case of N-IDR, we want to move relative to C-term.
+        # Use last residues of N-IDR for alignment.
+        last_res = res_seq == last_seq
+        idr_term_idx["N"] = \
+            int(np.flatnonzero(last_res & (atom_names == "N"))[-1])
+        idr_term_idx["CA"] = \
+            int(np.flatnonzero(last_res & (atom_names == "CA"))[-1])
+        idr_term_idx["C"] = \
+            int(np.flatnonzero((res_seq == last_seq - 1) & (atom_names == "C"))[-1])  # noqa: E501
     elif case == disorder_cases[2]:  # C-IDR
-        # We want to move relative to N-term of fragment
-        for i, atom in enumerate(atom_names):
-            seq = res_seq[i]
-
-            # Use first residues of C-IDR for alignment
-            if seq == first_seq + 1 and atom == "N":
-                idr_term_idx["N"] = i
-            elif seq == first_seq + 1 and atom == "CA":
-                idr_term_idx["CA"] = i
-            elif seq == first_seq and atom == "C":
-                idr_term_idx["C"] = i
-            elif seq == first_seq + 2:
-                break
+        # We want to move relative to N-term of fragment.
+        # Use first residues of C-IDR for alignment.
+        second_res = res_seq == first_seq + 1
+        idr_term_idx["N"] = \
+            int(np.flatnonzero(second_res & (atom_names == "N"))[0])
+        idr_term_idx["CA"] = \
+            int(np.flatnonzero(second_res & (atom_names == "CA"))[0])
+        idr_term_idx["C"] = \
+            int(np.flatnonzero((res_seq == first_seq) & (atom_names == "C"))[0])  # noqa: E501
 
     idr_Cxyz = sample[idr_term_idx["C"]][cols_coords].astype(float).tolist()
     idr_Nxyz = sample[idr_term_idx["N"]][cols_coords].astype(float).tolist()
@@ -599,20 +730,15 @@ def align_coords(sample, target, case):
     # Compute the rotation matrix
     rotation_matrix = np.dot(Vt.T, U.T)
 
+    # Keep coordinates as floats until the final write back to `sample`.
+    # Stringifying the rotated points just to re-parse them for the
+    # translation costs two per-element conversions on the whole chain.
     rotated_points = np.dot(idr_xyz, rotation_matrix)
-    sample[:, cols_coords] = rotated_points.astype(str)
-
-    translation_vector = \
-        target[0] - sample[idr_term_idx["C"]][cols_coords].astype(float)
 
-    for i, coords in enumerate(sample[:, cols_coords]):
-        x = str(round(translation_vector[0] + float(coords[0]), 3))
-        y = str(round(translation_vector[1] + float(coords[1]), 3))
-        z = str(round(translation_vector[2] + float(coords[2]), 3))
+    translation_vector = target[0] - rotated_points[idr_term_idx["C"]]
 
-        sample[i][col_x] = x
-        sample[i][col_y] = y
-        sample[i][col_z] = z
+    translated = np.round(rotated_points + translation_vector, 3)
+    sample[:, cols_coords] = translated.astype(str)
 
     return sample
 
@@ -701,16 +827,13 @@ def next_seeker(
             # |omega| angle must be greater than 150 deg
             if 1.32 <= CN_dist <= 1.56 and 1.91 <= CACN_ang <= 2.15 and 2.2 <= CCA_dist <= 2.7 and np.abs(omega) >= 2.61:  # noqa: E501
                 term_residue = idr_res[i]
-                
-                idr_list = []
-                for p, _ in enumerate(idr_resseq):
-                    next = idr_resseq[p + 1]
-                    idr_list.append(idr_arr[p])
-                    nterm_idr_arr = nterm_idr_arr[1:]
-                    if next == term_residue + 1:
-                        break
-                idr_arr = np.array(idr_list)
-                    
+
+                # keep the C-term IDR up to the matched residue and
+                # strip the same number of atoms from the N-term side
+                cut = int(np.flatnonzero(idr_resseq == term_residue + 1)[0])
+                idr_arr = idr_arr[:cut]
+                nterm_idr_arr = nterm_idr_arr[cut:]
+
                 nterm_idr_struc._data_array = nterm_idr_arr
                 
                 clashes, _ = count_clashes(
@@ -722,8 +845,7 @@ def next_seeker(
                     )
                 
                 if type(clashes) is int:
-                    nterm_idr_list = nterm_idr_arr.tolist()
-                    final_struc_arr = np.array(idr_list + nterm_idr_list)
+                    final_struc_arr = np.concatenate((idr_arr, nterm_idr_arr))
                     final_struc_name = final_struc_arr[:, col_name]
                     final_struc_res = final_struc_arr[:, col_resSeq].astype(int)
                     H_idx = -1  # for cases like Proline without "H"
@@ -815,74 +937,91 @@ def count_clashes(
         Array of the IDR fragment of interest
     """
     num_clashes = 0
-    
-    # PDB must have element column
-    parent_atoms = parent.data_array[:, col_element]
+
+    # Parent-side arrays are hoisted into a cache on the parent object
+    # because clash checks are retried many times against the same
+    # static parent (e.g. conformer regeneration in the ldrs client).
+    # The cache is renewed whenever the parent data array is replaced.
+    parent_data = parent.data_array
+    cached = getattr(parent, '_clash_cache', None)
+    if cached is None or cached['data'] is not parent_data:
+        cached = {
+            'data': parent_data,
+            # PDB must have element column
+            'coords': parent_data[:, cols_coords].astype(float),
+            'radii': vdw_radii_lookup(parent_data[:, col_element]),
+            'tree': None,  # built lazily for large parents
+            }
+        parent._clash_cache = cached
+    parent_coords = cached['coords']
+    vdw_radii1 = cached['radii']
+
     fragment_atoms = fragment[:, col_element]
     fragment_seq = fragment[:, col_resSeq].astype(int)
-    parent_coords = parent.data_array[:, cols_coords].astype(float)
     fragment_coords = fragment[:, cols_coords].astype(float)
     
     first_r = fragment_seq[0]
     last_r = fragment_seq[-1]
     
     if case == disorder_cases[0] or case == disorder_cases[1]:
-        # N-IDR or Linker-IDR, remove last 2 resiudes of fragment
-        # from consideration
-        for i, _ in enumerate(fragment_seq):
-            j = len(fragment_seq) - 1 - i
-            try:  # In case the user wants to build less than 3 residues
-                prev = fragment_seq[j - 1]
-            except IndexError:
-                continue
-            fragment_atoms = fragment_atoms[:-1]
-            fragment_coords = fragment_coords[:-1]
-            if last_r - prev == 3:
-                break
+        # N-IDR or Linker-IDR, remove last residues of fragment
+        # from consideration with a single boolean slice
+        keep = fragment_seq < last_r - 2
+        fragment_atoms = fragment_atoms[keep]
+        fragment_coords = fragment_coords[keep]
     elif case == disorder_cases[2]:
-        # C-IDR, remove first 2 residues of fragment from consideration
-        for i, _ in enumerate(fragment_seq):
-            try:  # In case the user wants to build less than 3 residues
-                next = fragment_seq[i + 1]
-            except IndexError:
-                continue
-            fragment_atoms = fragment_atoms[1:]
-            fragment_coords = fragment_coords[1:]
-            if next - first_r == 3:
-                break
+        # C-IDR, remove first residues of fragment from consideration
+        keep = fragment_seq > first_r + 2
+        fragment_atoms = fragment_atoms[keep]
+        fragment_coords = fragment_coords[keep]
     
     # Use matrix solution instead of nested for-loop to improve
     # clash checking speed at least 200-fold
     
-    # Create dictionary with all possible radii
-    all_vdw_radii = {**vdW_radii_tsai_1999, **vdW_radii_ionic_CRC82}
-    
-    # Calculate all distances
-    # In case there's too many atoms, we cannot use float64 or else we will
-    # run into a OOM (out of memory) error
-    distances = np.sqrt(
-        np.sum(
-            (parent_coords[:, np.newaxis, :] - fragment_coords) ** 2,
-            axis=-1,
-            dtype=dtype
-            ),
-        dtype=dtype
-        )
-    
     # Get all radii
-    vdw_radii1 = np.array([all_vdw_radii[atom] for atom in parent_atoms])
-    vdw_radii2 = np.array([all_vdw_radii[atom] for atom in fragment_atoms])
-    vdw_radii1 = vdw_radii1[:, np.newaxis]
-    vdw_radii2 = vdw_radii2[np.newaxis, :]
-    
-    # Get maximum radii and compare with distances
-    sum_radii = vdw_radii1 + vdw_radii2 + tolerance
-    clashes = distances < sum_radii
-    num_clashes = np.sum(clashes)
-    
+    vdw_radii2 = vdw_radii_lookup(fragment_atoms)
+
+    ncells = parent_coords.shape[0] * fragment_coords.shape[0]
+    if ncells > clash_matrix_max_cells:
+        # Large chains: a KD-tree on the parent restricts the check to
+        # atom pairs within the largest possible clash radius, avoiding
+        # the O(N*M) distance matrix entirely and allowing an early
+        # exit once the clash budget is exhausted.
+        if cached['tree'] is None:
+            cached['tree'] = cKDTree(parent_coords)
+        search_radius = vdw_radii1.max() + vdw_radii2.max() + tolerance
+        neighbors = cached['tree'].query_ball_point(
+            fragment_coords,
+            r=search_radius,
+            )
+        for j, hits in enumerate(neighbors):
+            if not hits:
+                continue
+            dist = np.linalg.norm(
+                parent_coords[hits] - fragment_coords[j],
+                axis=1,
+                )
+            thresholds = vdw_radii1[hits] + vdw_radii2[j] + tolerance
+            num_clashes += int(np.count_nonzero(dist < thresholds))
+            if num_clashes > max_clash:
+                return True, fragment
+    else:
+        # Calculate all distances in a single compiled kernel.
+        # `cdist` avoids materializing the (N, M, 3) difference tensor
+        # the broadcasted solution required; downcast to `dtype` to
+        # keep the (N, M) matrix small.
+        distances = \
+            cdist(parent_coords, fragment_coords).astype(dtype, copy=False)
+
+        # Get maximum radii and compare with distances
+        sum_radii = \
+            vdw_radii1[:, np.newaxis] + vdw_radii2[np.newaxis, :] + tolerance
+        clashes = distances < sum_radii
+        num_clashes = np.sum(clashes)
+
     if num_clashes > max_clash:
         return True, fragment
-    
+
     return int(num_clashes), fragment
 
 
@@ -932,11 +1071,9 @@ def psurgeon(
     if type(fld_struc) is Path:
         fld = Structure(fld_struc)
         fld.build()
-        fld_seq = fld.data_array[:, col_resSeq]
         fld_chain = fld.data_array[:, col_chainID]
         fld_data_array = fld.data_array
     else:
-        fld_seq = fld_struc.data_array[:, col_resSeq]
         fld_chain = fld_struc.data_array[:, col_chainID]
         fld_data_array = fld_struc.data_array
     
@@ -952,7 +1089,6 @@ def psurgeon(
         # Split the protein and membrane
         fld_pro = np.array(fld_pro)
         fld_data_array = fld_pro
-        fld_seq = fld_pro[:, col_resSeq]
         fld_chain = fld_pro[:, col_chainID]
     
     # If only lists are given instead of dictionary
@@ -975,38 +1111,22 @@ def psurgeon(
         c = case[chain]
         r = ranges[chain]
         fld_data_lst = fld_data_array.tolist()
-        fld_seq_lst = fld_seq.tolist()
         fld_data_seg_lst = []
-        fld_seq_seg_lst = []
 
         for i, ch in enumerate(fld_chain):
             if ch == chain or ch is None or ch == '':
                 fld_data_seg_lst.append(fld_data_lst[i])
-                fld_seq_seg_lst.append(fld_seq_lst[i])
-        
+
         fld_data_seg = np.array(fld_data_seg_lst)
-        fld_seq_seg = np.array(fld_seq_seg_lst)
         if disorder_cases[0] in c:
             # N-IDR, remove last resiude of fragment
             # and remove the first residue of folded-domain
             nidr = Structure(idp_lst[chain][0])
             nidr.build()
             nidr_seq = nidr.data_array[:, col_resSeq]
-            nidr_data_array = nidr.data_array
-
-            for i, _ in enumerate(nidr_seq):
-                j = len(nidr_seq) - 1 - i
-                curr = nidr_seq[j]
-                prev = nidr_seq[j - 1]
-                nidr_data_array = nidr_data_array[:-1]
-                if prev != curr:
-                    break
-
-            for i, seq in enumerate(fld_seq_seg):
-                next = fld_seq_seg[i + 1]
-                fld_data_seg = fld_data_seg[1:]
-                if next != seq:
-                    break
+            nidr_data_array = nidr.data_array[nidr_seq != nidr_seq[-1]]
+            fld_data_seg = \
+                fld_data_seg[fld_data_seg[:, col_resSeq] != fld_data_seg[0, col_resSeq]]  # noqa: E501
 
             idp_lst[chain].pop(0)
             r.pop(0)
@@ -1018,21 +1138,9 @@ def psurgeon(
             cidr = Structure(idp_lst[chain][-1])
             cidr.build()
             cidr_seq = cidr.data_array[:, col_resSeq]
-            cidr_data_array = cidr.data_array
-
-            for i, seq in enumerate(cidr_seq):
-                next = cidr_seq[i + 1]
-                cidr_data_array = cidr_data_array[1:]
-                if next != seq:
-                    break
-
-            for i, _ in enumerate(fld_seq_seg):
-                j = len(fld_seq_seg) - 1 - i
-                curr = fld_seq_seg[j]
-                prev = fld_seq_seg[j - 1]
-                fld_data_seg = fld_data_seg[:-1]
-                if prev != curr:
-                    break
+            cidr_data_array = cidr.data_array[cidr_seq != cidr_seq[0]]
+            fld_data_seg = \
+                fld_data_seg[fld_data_seg[:, col_resSeq] != fld_data_seg[-1, col_resSeq]]  # noqa: E501
 
             # Fix residue connectivity issue
             last_residue_fld = int(fld_data_seg[:, col_resSeq][-1])
@@ -1075,22 +1183,12 @@ def psurgeon(
                 idr.build()
 
                 idr_seq = idr.data_array[:, col_resSeq].astype(int)
-                idr_data_array = idr.data_array
                 last_res = idr_seq[-1]
                 # Linker-IDR, remove first and last residue of fragment
                 # and the first residues on either side of the chain break
-                for i, seq in enumerate(idr_seq):
-                    next = idr_seq[i + 1]
-                    j = len(idr_seq) - 1 - i
-                    rev = idr_seq[j]
-
-                    if seq == 1:
-                        idr_data_array = idr_data_array[1:]
-                    if rev == last_res:
-                        idr_data_array = idr_data_array[:-1]
-                    if seq > 2 and rev < last_res - 1:
-                        break
-                    
+                idr_data_array = \
+                    idr.data_array[(idr_seq != 1) & (idr_seq != last_res)]
+
                 idr_data_lst = idr_data_array.tolist()
                 surrounding_data_list = []
                 if disorder_cases[0] not in c:
@@ -1131,19 +1229,55 @@ def psurgeon(
     return new_struc_arr_complete
 
 
-def inter_chain_cc(all_files, nconfs):
+def candidate_combo_clash_check(candidate_combo):
+    """
+    Clash-check one candidate inter-chain combination.
+
+    Parameters
+    ----------
+    candidate_combo : list of list of Path
+        One list of IDR paths per chain.
+
+    Returns
+    -------
+    candidate_combo or False
+        False if any pair of IDRs from different chains clash.
+    """
+    for i in range(len(candidate_combo)):
+        for j in range(i + 1, len(candidate_combo)):
+            idr_set1 = candidate_combo[i]
+            idr_set2 = candidate_combo[j]
+            idr_pairs = product(idr_set1, idr_set2)
+            for pair in idr_pairs:
+                frag_s = Structure(pair[0])
+                struc_s = Structure(pair[1])
+                frag_s.build()
+                struc_s.build()
+                clashes, _ = count_clashes(frag_s.data_array, struc_s)
+                if clashes:
+                    return False
+    return candidate_combo
+
+
+def inter_chain_cc(all_files, nconfs, ncores=1):
     """
     Check for clashes between all chains of IDRs.
 
+    Candidate combinations are independent of each other, so each batch
+    is validated in parallel across `ncores` processors.
+
     Parameters
     ----------
     all_files : dict
         Keys are chains and values are lists of Paths
         for IDRs selected that don't clash with each other.
-    
+
     nconfs : int
         Number of final conformers.
-    
+
+    ncores : int
+        Number of cores to use for clash-checking.
+
     Returns
     -------
     final_combos : list of dict
@@ -1155,41 +1289,29 @@ def inter_chain_cc(all_files, nconfs):
     all_chains = all_files.keys()
 
     while len(final_combos) < nconfs:
-        reset = False
-        random_combo = [random.randint(0, nconfs - 1) for _ in range(total_chains)]  # noqa: E501
-        candidate_combo = []
-        
-        for i, selections in enumerate(all_files.values()):
-            sele = selections[random_combo[i]]
-            if type(sele) is list:
-                candidate_combo.append(sele)
-            else:
-                candidate_combo.append([sele])
-            
-        for i in range(len(candidate_combo)):
-            for j in range(i + 1, len(candidate_combo)):
-                idr_set1 = candidate_combo[i]
-                idr_set2 = candidate_combo[j]
-                idr_pairs = product(idr_set1, idr_set2)
-                for pair in idr_pairs:
-                    frag_s = Structure(pair[0])
-                    struc_s = Structure(pair[1])
-                    frag_s.build()
-                    struc_s.build()
-                    clashes, _ = count_clashes(frag_s.data_array, struc_s)
-                    if clashes:
-                        reset = True
-                        break
-                if reset:
-                    break
-            if reset:
-                break
-        if reset:
-            continue
-        else:
-            temp_dict = {}
-            for i, c in enumerate(all_chains):
-                temp_dict[c] = candidate_combo[i]
-            final_combos.append(temp_dict)
+        batch = []
+        for _ in range(nconfs - len(final_combos)):
+            random_combo = [random.randint(0, nconfs - 1) for _ in range(total_chains)]  # noqa: E501
+            candidate_combo = []
+
+            for i, selections in enumerate(all_files.values()):
+                sele = selections[random_combo[i]]
+                if type(sele) is list:
+                    candidate_combo.append(sele)
+                else:
+                    candidate_combo.append([sele])
+            batch.append(candidate_combo)
+
+        execute_clash = pool_function(
+            candidate_combo_clash_check,
+            batch,
+            ncores=ncores,
+            )
+        for result in execute_clash:
+            if result is not False:
+                temp_dict = {}
+                for i, c in enumerate(all_chains):
+                    temp_dict[c] = result[i]
+                final_combos.append(temp_dict)
 
     return final_combos
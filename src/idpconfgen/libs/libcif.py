@@ -2,9 +2,15 @@
 import os
 import re
 
+import numpy as np
+
 from idpconfgen.core import exceptions as EXCPTS
 
 
+# compiled once at import, `is_cif` is called per downloaded structure
+rgx_cif_loop = re.compile('[lL][oO][oO][pP]_')
+
+
 class CIFParser:
     """
     mmCIFParser for structural data ONLY.
@@ -19,6 +25,7 @@ class CIFParser:
 
     __slots__ = [
         '_auth_label',
+        '_label_order',
         '_len',
         '_line',
         'cif_dict',
@@ -32,6 +39,10 @@ class CIFParser:
             }
 
         self._auth_label = _label_priority[label_priority]
+        self._label_order = {
+            'auth': ('auth', 'label'),
+            'label': ('label', 'auth'),
+            }[label_priority]
         self.cif_dict = {}
         self.read_cif(datastr)
         self.line = 0
@@ -99,6 +110,84 @@ class CIFParser:
             self.charge,
             ]
 
+    def get_columns_for_PDB(self):
+        """
+        Retrieve all PDB columns at once, one array per field.
+
+        Structure-of-arrays counterpart of
+        :meth:`get_line_elements_for_PDB`: the auth/label key resolution
+        happens once per field instead of once per atom, and the
+        '?'/'.' voiding runs vectorized over whole columns.
+
+        Return
+        ------
+        list of np.ndarray of dtype '<U8'
+            One array of length ``len(self)`` per PDB column, ordered as
+            in :meth:`get_line_elements_for_PDB`.
+        """
+        cd = self.cif_dict
+        nrows = len(self)
+
+        def arr(values):
+            return np.asarray(values, dtype='<U8')
+
+        def void(array):
+            # vectorized equivalent of `_translate`
+            return np.char.replace(np.char.replace(array, '?', ' '), '.', ' ')
+
+        record = arr(cd['_atom_site.group_PDB'])
+
+        try:
+            serial = arr(cd['_atom_site.Id'])
+        except KeyError:
+            serial = arr(cd['_atom_site.id'])
+
+        atname = arr(self._column('atom_id'))
+        altloc = np.char.replace(void(arr(self._column('alt_id'))), '1', 'A')
+        resname = arr(self._column('comp_id'))
+
+        chainid = arr(self._column('asym_id'))
+        if '_atom_site.auth_asym_id' in cd:
+            chainid = np.where(
+                np.isin(chainid, ('?', '.')),
+                arr(cd['_atom_site.auth_asym_id']),
+                chainid,
+                )
+
+        resseq = void(arr(self._column('seq_id')))
+
+        try:
+            icode = void(arr(cd['_atom_site.pdbx_PDB_ins_code']))
+        except KeyError:
+            icode = np.full(nrows, ' ', dtype='<U8')
+
+        return [
+            record,
+            serial,
+            atname,
+            altloc,
+            resname,
+            chainid,
+            resseq,
+            icode,
+            arr(cd['_atom_site.Cartn_x']),
+            arr(cd['_atom_site.Cartn_y']),
+            arr(cd['_atom_site.Cartn_z']),
+            arr(cd['_atom_site.occupancy']),
+            arr(cd['_atom_site.B_iso_or_equiv']),
+            np.full(nrows, ' ', dtype='<U8'),  # segid
+            arr(cd['_atom_site.type_symbol']),
+            void(arr(cd['_atom_site.pdbx_formal_charge'])),
+            ]
+
+    def _column(self, label):
+        """Resolve a full column honoring the auth/label priority."""
+        first, second = self._label_order
+        try:
+            return self.cif_dict[f'_atom_site.{first}_{label}']
+        except KeyError:
+            return self.cif_dict[f'_atom_site.{second}_{label}']
+
     def get_value(self, label):
         """Retrieve the label value for the current :attr:`line`."""
         return self.cif_dict[label][self.line]
@@ -210,8 +299,7 @@ def is_cif(datastr):
     """Detect if `datastr` is a CIF file."""
     assert isinstance(datastr, str), \
         f'`datastr` is not str: {type(datastr)} instead'
-    cif_loop = re.compile('[lL][oO][oO][pP]_')
-    return bool(cif_loop.search(datastr))
+    return bool(rgx_cif_loop.search(datastr))
 
 
 def find_cif_atom_site_headers(lines, cif_dict):
@@ -298,6 +386,9 @@ def populate_cif_dictionary(lines, start_index, cif_dict):
     assert len(lines) > start_index
 
     valid_len = len(cif_dict)
+    # bound .append methods hoisted out of the loop: one dict lookup per
+    # key per file instead of per line
+    appends = [cif_dict[key].append for key in cif_dict.keys()]
     for counter, line in enumerate(lines[start_index:]):
         # expects all coordinate related lines to be consecutive
         # Usually the coordinate block ends with an "#"
@@ -318,8 +409,8 @@ def populate_cif_dictionary(lines, start_index, cif_dict):
                 )
             raise EXCPTS.CIFFileError(errmsg=errmsg)
 
-        for i, key in enumerate(cif_dict.keys()):
-            cif_dict[key].append(ls[i])
+        for append, element in zip(appends, ls):
+            append(element)
 
 
 def parse_cif_line(line):
@@ -336,6 +427,10 @@ def parse_cif_line(line):
     list
         A list with the parsed line elements.
     """
+    # the regex only matters for quoted fields; atom_site rows almost
+    # never have them and str.split is a single C pass
+    if "'" not in line and '"' not in line:
+        return line.split()
     CLR = cif_line_regex
     return [''.join(t).strip() for t in CLR.findall(line)]
 
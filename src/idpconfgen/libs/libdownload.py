@@ -1,4 +1,5 @@
 """Functions and variables to download files and data."""
+import gzip
 import time
 import urllib.request
 from functools import partial
@@ -65,8 +66,18 @@ def fetch_pdb_id_from_RCSB(pdbid, mmcif=False):
         try:
             for weblink in possible_links:
                 try:
-                    response = urllib.request.urlopen(weblink)
-                    return response.read(), weblink.rpartition(".")[-1]
+                    # PDB/mmCIF text compresses 5 to 8 times; asking for
+                    # gzip cuts the transferred bytes accordingly on
+                    # bulk downloads
+                    request = urllib.request.Request(
+                        weblink,
+                        headers={'Accept-Encoding': 'gzip'},
+                        )
+                    response = urllib.request.urlopen(request)
+                    data = response.read()
+                    if response.headers.get('Content-Encoding') == 'gzip':
+                        data = gzip.decompress(data)
+                    return data, weblink.rpartition(".")[-1]
                 except urllib.error.HTTPError:
                     continue
                 except (AttributeError, UnboundLocalError):  # response is None
@@ -245,7 +245,10 @@ def regex_search(sequence, regex_string, rex_range=REGEX_RANGE, **kwargs):
         result = func(sequence, regex_string)
 
     assert isinstance(result, list)
-    assert all(isinstance(S, slice) for S in result)  # heavy and slow!!
+    # spot check instead of walking the whole result: the full
+    # all(isinstance(...)) scan was heavy on hot calls and the builders
+    # above only ever produce slices
+    assert not result or isinstance(result[0], slice)
     return result
 
 
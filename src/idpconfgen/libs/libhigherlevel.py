@@ -5,8 +5,9 @@ Function which operate with several libraries
 and are defined here to avoid circular imports.
 """
 import re
+from collections import defaultdict
 from contextlib import suppress
-from functools import partial, reduce
+from functools import partial
 
 import numpy as np
 
@@ -30,9 +31,9 @@ from idpconfgen.libs.libcalc import (
     rrd10_njit,
     )
 from idpconfgen.libs.libio import (
+    PairSaver,
     concatenate_entries,
     read_PDBID_from_source,
-    save_pairs_to_disk,
     )
 from idpconfgen.libs.libmulticore import (
     consume_iterable_in_list,
@@ -99,18 +100,13 @@ def download_pipeline(func, logfilename='.download'):
             )
 
         # comparison block
-        def diff(first, other):
-            return first.difference(other)
+        # a single union plus difference builds one hash table and
+        # avoids the intermediate PDBList a chained difference creates
+        excluded = \
+            read_PDBID_from_source(destination).set \
+            | PDBList(blocked_ids).set
 
-        remove_from_input = [
-            read_PDBID_from_source(destination),
-            PDBList(blocked_ids),
-            ]
-
-        # yes, there are just two items in remove_from_input, why use reduce?
-        # what if more are added in the future? :-P
-        # the engine is already created
-        pdblist_comparison = reduce(diff, remove_from_input, pdblist)
+        pdblist_comparison = PDBList(pdblist.set - excluded)
         log.info(S(f'Found {str(pdblist_comparison)} to download'))
         #
 
@@ -140,11 +136,13 @@ def download_pipeline(func, logfilename='.download'):
                 chunks=chunks,
                 )
 
-            flat_results_from_chunk(
-                execute_pool,
-                save_pairs_to_disk,
-                destination=destination,
-                )
+            # the destination handle (the archive, for TAR destinations)
+            # opens once for the whole download instead of once per chunk
+            with PairSaver(destination) as pair_saver:
+                flat_results_from_chunk(
+                    execute_pool,
+                    pair_saver.save,
+                    )
 
             log.info(T('Reading UPDATED destination'))
             pdblist_updated = read_PDBID_from_source(destination)
@@ -178,6 +176,7 @@ def extract_secondary_structure(
         atoms='all',
         minimum=0,
         structure='all',
+        pre_split_lines=None,
         ):
     """
     Extract secondary structure elements from PDB data.
@@ -205,13 +204,21 @@ def extract_secondary_structure(
     structure : str or list of chars
         The secondary structure character to separate.
         Multiple can be given in the form of a list.
+
+    pre_split_lines : list of bytes, optional
+        The PDB data in index 1 of `pdbid` already split by newlines.
+        Callers extracting several configurations from the same PDB can
+        split once and reuse the list across calls.
     """
     # caused problems in the past
     assert atoms != ['all']
     assert structure != ['all']
 
     pdbname = Path(pdbid[0]).stem
-    pdbdata = pdbid[1].split(b'\n')
+    if pre_split_lines is None:
+        pdbdata = pdbid[1].split(b'\n')
+    else:
+        pdbdata = pre_split_lines
 
     # gets PDB computed data from dictionary
     try:
@@ -222,40 +229,70 @@ def extract_secondary_structure(
     if structure == 'all':
         ss_to_isolate = set(pdbdd['dssp'])
     else:
-        ss_to_isolate = set(structure)
+        # requested characters absent from this DSSP yield nothing,
+        # so drop them before doing any per-line work
+        ss_to_isolate = set(pdbdd['dssp']).intersection(structure)
 
-    # general lines filters
-    line_filters = []
-    LF_append = line_filters.append
-    LF_pop = line_filters.pop
+    if not ss_to_isolate:
+        return
 
     # in atoms filter
     if atoms != 'all':
         with suppress(AttributeError):  # it is more common to receive str
             atoms = [c.encode() for c in atoms]
-        line_filters.append(lambda x: x[atom_name].strip() in atoms)
+        atoms = frozenset(atoms)
+
+    # the resSeq and atom name columns of every line are sliced once
+    # here; the segment loop below reuses them by direct membership
+    # tests instead of re-slicing each line per segment
+    line_meta = [
+        (line[atom_resSeq].strip(), line[atom_name].strip())
+        for line in pdbdata
+        ]
+
+    # group the DSSP slices by their SS char once, instead of rescanning
+    # the whole slice list for every item of `ss_to_isolate`
+    slices_by_ss = defaultdict(list)
+    for char, slice_ in group_by(pdbdd['dssp']):
+        slices_by_ss[char].append(slice_)
 
-    dssp_slices = group_by(pdbdd['dssp'])
     # DR stands for dssp residues
     DR = [c for c in pdbdd['resids'].encode().split(b',')]
 
     for ss in ss_to_isolate:
 
-        ssfilter = (slice_ for char, slice_ in dssp_slices if char == ss)
-        minimum_size = (s for s in ssfilter if s.stop - s.start >= minimum)
+        minimum_size = [
+            s
+            for s in slices_by_ss.get(ss, ())
+            if s.stop - s.start >= minimum
+            ]
 
         for counter, seg_slice in enumerate(minimum_size):
 
-            LF_append(lambda x: x[atom_resSeq].strip() in DR[seg_slice])  # noqa: E501, B023
+            DR_seg = set(DR[seg_slice])
 
-            pdb = b'\n'.join(
-                line for line in pdbdata if all(f(line) for f in line_filters)
-                )
-            LF_pop()
+            if atoms == 'all':
+                kept = (
+                    line
+                    for line, (resseq, _) in zip(pdbdata, line_meta)
+                    if resseq in DR_seg
+                    )
+            else:
+                kept = (
+                    line
+                    for line, (resseq, aname) in zip(pdbdata, line_meta)
+                    if resseq in DR_seg and aname in atoms
+                    )
 
-            yield f'{pdbname}_{ss}_{counter}.pdb', pdb
+            # bytearray growth is amortised; join would first
+            # materialise the full list of matched lines
+            buf = bytearray()
+            for line in kept:
+                if buf:
+                    buf += b'\n'
+                buf += line
 
-            counter += 1
+            yield f'{pdbname}_{ss}_{counter}.pdb', bytes(buf)
 
 
 def get_torsionsJ(
@@ -433,10 +470,9 @@ def get_torsions(fdata, degrees=False, decimals=3, validate=True):
         raise IDPConfGenException(errmsg) from err
 
     try:
-        coords = np.empty((n.shape[0] * 3, 3), dtype=np.float64)
-        coords[0::3, :] = n
-        coords[1::3, :] = ca
-        coords[2::3, :] = c
+        # one contiguous write instead of allocating and filling the
+        # interleaved array with three strided assignments
+        coords = np.stack((n, ca, c), axis=1).reshape(-1, 3)
     except ValueError as err:
         errmsg = (
             'Coordinates do not match expectation. '
@@ -6,11 +6,19 @@ import os
 import pickle
 import tarfile
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from io import BytesIO
 from os import SEEK_END
 from pprint import pprint
 
+
+try:
+    import orjson
+    has_orjson = True
+except ImportError:
+    has_orjson = False
+
 from idpconfgen import Path, log
 from idpconfgen.libs import get_false
 from idpconfgen.libs.libfunc import is_none
@@ -601,6 +609,26 @@ def save_dict_to_json(
         ):
     """Save dictionary to JSON."""
     assert Path(output).suffix == '.json'
+    if has_orjson:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        jsondumps = partial(orjson.dumps, option=option)
+        try:
+            try:
+                serialized = jsondumps(mydict)
+            except TypeError:
+                # it may come a Manager.dict()
+                # we need to convert it to dict before json it
+                serialized = jsondumps(dict(mydict))
+        except TypeError:
+            # orjson rejects types the stdlib accepts, for example the
+            # numpy scalars torsionsJ emits; use the stdlib writer below
+            pass
+        else:
+            with open(output, 'wb') as fout:
+                fout.write(serialized)
+            return
     jsondump = partial(json.dump, indent=indent, sort_keys=sort_keys)
     with open(output, 'w') as fout:
         try:
@@ -664,6 +692,50 @@ def save_pairs_to_disk(pairs, destination):
     dispacher[dest.suffix](pairs, dest)
 
 
+class PairSaver:
+    """
+    Save successive batches of pairs to a single destination.
+
+    Unlike :func:`save_pairs_to_disk`, which reopens a TAR destination
+    for every call and rewrites the archive trailer each time, this
+    object opens the archive once and keeps the handle until
+    :meth:`close`. Folder destinations fall back to
+    :func:`save_pairs_to_files`.
+
+    Parameters
+    ----------
+    destination : str or Path, optional
+        A folder or a ``.tar`` file. Defaults to the CWD.
+    """
+
+    def __init__(self, destination=None):
+        self.dest = Path(destination) if destination else Path.cwd()
+        self._tar = None
+        if self.dest.suffix == '.tar':
+            mode = 'a:' if self.dest.exists() else 'w'
+            self._tar = tarfile.open(os.fspath(self.dest), mode=mode)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def save(self, pairs):
+        """Save a batch of (file name, data content) pairs."""
+        if self._tar is not None:
+            for fout, data in pairs:
+                save_file_to_tar(self._tar, fout, data)
+        else:
+            save_pairs_to_files(pairs, destination=self.dest)
+
+    def close(self):
+        """Close the destination handle, if any."""
+        if self._tar is not None:
+            self._tar.close()
+            self._tar = None
+
+
 # USED OKAY
 def save_pairs_to_tar(pairs, destination):
     """
@@ -708,12 +780,22 @@ def save_pairs_to_files(pairs, destination=None):
         Defauls to the CWD.
     """
     dest = make_destination_folder(destination)
-    for k, v in pairs:
+
+    def _write_pair(pair):
+        k, v = pair
         try:
             Path(dest, k).write_text(v)
         except TypeError:
             Path(dest, k).write_bytes(v)
 
+    # file writes release the GIL, so a thread pool overlaps the
+    # open/write/close syscall round-trips of the many small files
+    # instead of paying them one at a time
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # consume the iterator to surface exceptions raised in threads
+        for _ in executor.map(_write_pair, pairs):
+            pass
+
 
 class FileReaderIterator:
     """
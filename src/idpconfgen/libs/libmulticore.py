@@ -51,8 +51,63 @@ def flat_results_from_chunk(execute, func, *args, **kwargs):
         func(flatted, *args, **kwargs)
 
 
+def pool_chunksize(items, ncores):
+    """
+    Compute a `Pool` dispatch chunksize for `items`.
+
+    Batches tasks so per-task IPC does not dominate short workloads,
+    while keeping enough batches per core for load balancing.
+
+    Parameters
+    ----------
+    items : iterable
+        The items to process. If it has no length (a generator),
+        returns `1`.
+
+    ncores : int
+        The number of cores used.
+    """
+    try:
+        nitems = len(items)
+    except TypeError:
+        return 1
+    return max(1, nitems // (ncores * 4))
+
+
+def consume_pool_imap(imap, pb):
+    """
+    Yield results from a `Pool` imap iterator.
+
+    Reports progress and logs the known recoverable errors.
+
+    Parameters
+    ----------
+    imap : iterator
+        The iterator returned by the `Pool` method.
+
+    pb : ProgressWatcher
+        An already entered progress watcher context.
+    """
+    # the use of `while` here is needed, instead of for
+    # to allo try/catch options
+    while True:
+        try:
+            yield next(imap)
+            pb.increment()
+        except StopIteration:
+            break
+        except IndexError:
+            log.error('IndexError of multiprocessing, ignoring something')
+        except ReportOnCrashError:
+            # nothing to do, report did it already
+            continue
+        except IDPConfGenException as err:
+            log.debug(traceback.format_exc())
+            log.error(err)
+
+
 # USED OKAY
-def pool_function(func, items, method='imap_unordered', ncores=1):
+def pool_function(func, items, method='imap_unordered', ncores=1, chunksize=None):  # noqa: E501
     """
     Multiprocess Pools a function.
 
@@ -72,34 +127,34 @@ def pool_function(func, items, method='imap_unordered', ncores=1):
 
     ncores : int
         The number of cores to use. Defaults to `1`.
+
+    chunksize : int, optional
+        The `Pool` dispatch chunksize.
+        Defaults to the `pool_chunksize` heuristic.
     """
+    if chunksize is None:
+        chunksize = pool_chunksize(items, ncores)
     with Pool(ncores) as pool, \
             ProgressWatcher(items, suffix=f'on {ncores} cpus') as pb:
-        imap = getattr(pool, method)(func, items)
-        # the use of `while` here is needed, instead of for
-        # to allo try/catch options
-        while True:
-            try:
-                yield next(imap)
-                pb.increment()
-            except StopIteration:
-                break
-            except IndexError:
-                log.error('IndexError of multiprocessing, ignoring something')
-            except ReportOnCrashError:
-                # nothing to do, report did it already
-                continue
-            except IDPConfGenException as err:
-                log.debug(traceback.format_exc())
-                log.error(err)
+        imap = getattr(pool, method)(func, items, chunksize=chunksize)
+        yield from consume_pool_imap(imap, pb)
 
 
 # USED OKAY
-def pool_function_in_chunks(func, items, chunks=5_000, **kwargs):
+def pool_function_in_chunks(
+        func,
+        items,
+        chunks=5_000,
+        method='imap_unordered',
+        ncores=1,
+        chunksize=None,
+        ):
     """
     Execute ``func`` in ``chunks`` of ``items`` using `Pool`.
 
-    Yields the results after each fragment.
+    Yields the results after each fragment. A single `Pool` serves all
+    fragments; spawning one per fragment pays the worker startup cost
+    repeatedly.
 
     Parameters
     ----------
@@ -111,20 +166,29 @@ def pool_function_in_chunks(func, items, chunks=5_000, **kwargs):
     items : iterable
         The items to process by the ``funct``.
 
-    *args : any
-        Additional positional arguments to send to ``func``.
-
     chunks : int
         The size of each fragment processed multiprocessing before yielding.
 
-    **kwargs : any
-        Additional keyword arguments to send to ``func``.
+    method : str
+        The :class:`Pool` method to execute.
+        Defaults to `imap_unordered`.
+
+    ncores : int
+        The number of cores to use. Defaults to `1`.
+
+    chunksize : int, optional
+        The `Pool` dispatch chunksize.
+        Defaults to the `pool_chunksize` heuristic per fragment.
 
     Yields
     ------
     list
         Containing the results after each fragment.
     """
-    for i in range(0, len(items), chunks):
-        task = items[i: i + chunks]
-        yield list(pool_function(func, task, **kwargs))
+    with Pool(ncores) as pool:
+        for i in range(0, len(items), chunks):
+            task = items[i: i + chunks]
+            _chunksize = chunksize or pool_chunksize(task, ncores)
+            with ProgressWatcher(task, suffix=f'on {ncores} cpus') as pb:
+                imap = getattr(pool, method)(func, task, chunksize=_chunksize)
+                yield list(consume_pool_imap(imap, pb))
@@ -11,6 +11,7 @@ from itertools import product, repeat
 from operator import setitem
 from pathlib import Path as Path_
 
+import numpy as np
 from numba import njit
 
 from idpconfgen import Path, log
@@ -90,17 +91,17 @@ def group_by(data):
     """
     assert len(data) > 0
 
-    datum_hold = prev = data[0]
-    start = 0
-    groups = []
-    GA = groups.append
-    for i, datum in enumerate(data):
-        if datum != prev:
-            GA([datum_hold, slice(start, i)])
-            datum_hold, start = datum, i
-        prev = datum
-    else:
-        GA([datum_hold, slice(start, i + 1)])
+    # run-length encoding in NumPy: one vectorized comparison finds all
+    # group boundaries instead of a per-item Python loop
+    arr = np.asarray(list(data))
+    change = np.flatnonzero(arr[1:] != arr[:-1]) + 1
+    starts = np.concatenate(([0], change))
+    stops = np.concatenate((change, [len(data)]))
+
+    groups = [
+        [data[int(i)], slice(int(i), int(j))]
+        for i, j in zip(starts, stops)
+        ]
 
     assert isinstance(groups[0][0], str)
     assert isinstance(groups[0][1], slice)
@@ -110,15 +111,12 @@ def group_by(data):
 # from https://stackoverflow.com/questions/21142231
 def group_runs(li, tolerance=1):
     """Group consecutive numbers given a tolerance."""
-    out = []
-    last = li[0]
-    for x in li:
-        if x - last > tolerance:
-            yield out
-            out = []
-        out.append(x)
-        last = x
-    yield out
+    li[0]  # keeps the original IndexError on empty input
+    arr = np.asarray(li)
+    # vectorized equivalent of comparing each number to its predecessor
+    breaks = np.flatnonzero(arr[1:] - arr[:-1] > tolerance) + 1
+    for seg in np.split(arr, breaks):
+        yield seg.tolist()
 
 
 def mkdssp_w_split(pdb, cmd, **kwargs):
@@ -172,6 +170,11 @@ def split_pdb_by_dssp(pdbfile, dssp_text, minimum=2, reduced=False):
     with open(pdbfile, 'rb') as fin:
         pdb_bytes = fin.readlines()
 
+    # the resSeq column of every line is inspected once here instead of
+    # once per segment inside the loop below
+    resseqs = [line[atom_resSeq].strip() for line in pdb_bytes]
+    is_hetatm = [line.startswith(b'HETATM') for line in pdb_bytes]
+
     segs = 0
     pdbname = str(PDBIDFactory(pdbfile.stem))
     # converted because end product is to be saved in json or used as string
@@ -183,14 +186,16 @@ def split_pdb_by_dssp(pdbfile, dssp_text, minimum=2, reduced=False):
 
         residues_set = set(residues)
 
-        lines2write = [
-            line for line in pdb_bytes
-            if line[atom_resSeq].strip() in residues_set
+        keep = [
+            i for i, resseq in enumerate(resseqs)
+            if resseq in residues_set
             ]
 
-        if all(line.startswith(b'HETATM') for line in lines2write):
+        if all(is_hetatm[i] for i in keep):
             continue
 
+        lines2write = [pdb_bytes[i] for i in keep]
+
         # it is much faster to decode three small strings here
         # than a whole DSSP file at the beginning
         __data = {
@@ -85,6 +85,11 @@ def delete_insertions(lines):
         yield line
 
 
+# there are only a few dozen distinct (atom, element) pairs per
+# proteome, memoizing skips the strip/len/format machinery per line
+_atom_name_cache = {}
+
+
 def format_atom_name(atom, element, AFD=_atom_format_dict):
     """
     Format PDB Record line Atom name.
@@ -106,12 +111,17 @@ def format_atom_name(atom, element, AFD=_atom_format_dict):
     str
         Formatted atom name.
     """
+    try:
+        return _atom_name_cache[(atom, element)]
+    except KeyError:
+        pass
+
     atm = atom.strip()
     len_atm = len(atm)
     len_ele = len(element.strip())
 
     try:
-        return AFD[len_ele][len_atm].format(atm)
+        formatted = AFD[len_ele][len_atm].format(atm)
     except KeyError as err:
         _ = f'Could not format this atom:type -> {atom}:{element}'
         # raising KeyError assures that no context in IDPConfGen
@@ -119,6 +129,9 @@ def format_atom_name(atom, element, AFD=_atom_format_dict):
         # exceptions, those are treated as bugs.
         raise KeyError(_) from err
 
+    _atom_name_cache[(atom, element)] = formatted
+    return formatted
+
 
 def format_chainid(chain):
     """
@@ -217,7 +230,8 @@ def is_pdb(datastr):
     """Detect if `datastr` if a PDB format v3 file."""
     assert isinstance(datastr, str), \
         f'`datastr` is not str: {type(datastr)} instead'
-    return bool(datastr.count('\nATOM ') > 0)
+    # `in` stops at the first hit; `.count` scanned the whole file
+    return '\nATOM ' in datastr
 
 
 class PDBIDFactory:
@@ -251,6 +265,18 @@ class PDBIDFactory:
     rgx_XXXX_C_segS = re.compile(r'^[0-9a-zA-Z]{4}_[0-9a-zA-Z]+_seg\d+(\s|$)')
     rgx_any = re.compile(r'\w+(\.pdb)?')
 
+    # the four anchored forms above combined into a single automaton;
+    # alternatives ordered longest first so each name matches its most
+    # specific form, the group name selects the parser
+    rgx_combined = re.compile(
+        r'^(?:'
+        r'(?P<XXXX_C_segS>[0-9a-zA-Z]{4}_[0-9a-zA-Z]+_seg\d+)'
+        r'|(?P<XXXX_C>[0-9a-zA-Z]{4}_[0-9a-zA-Z]+)'
+        r'|(?P<XXXXC>[0-9a-zA-Z]{5,})'
+        r'|(?P<XXXX>[0-9a-zA-Z]{4})'
+        r')(?:\s|$)'
+        )
+
     def __new__(cls, name):
         """Construct class."""
         if isinstance(name, PDBID):
@@ -261,17 +287,18 @@ class PDBIDFactory:
             name = namep.stem
 
         # where XXXX is the PDBID and C the chain ID
-        pdb_filename_regex = {
-            cls.rgx_XXXX: cls._parse_XXXX,
-            cls.rgx_XXXXC: cls._parse_XXXXC,
-            cls.rgx_XXXX_C: cls._parse_XXXX_C,
-            cls.rgx_XXXX_C_segS: cls._parse_XXXX_C_segS,
-            cls.rgx_any: cls._parse_any_name,
+        parsers = {
+            'XXXX': cls._parse_XXXX,
+            'XXXXC': cls._parse_XXXXC,
+            'XXXX_C': cls._parse_XXXX_C,
+            'XXXX_C_segS': cls._parse_XXXX_C_segS,
             }
 
-        for regex, parser in pdb_filename_regex.items():
-            if regex.search(str(name)):  # in case Path obj
-                return PDBID(*parser(name))
+        match = cls.rgx_combined.match(str(name))  # in case Path obj
+        if match:
+            return PDBID(*parsers[match.lastgroup](name))
+        elif cls.rgx_any.search(str(name)):
+            return PDBID(*cls._parse_any_name(name))
         else:
             emsg = f"PDB code format not valid: {name}. No regex matches."
             raise EXCPTS.PDBIDFactoryError(emsg)
@@ -321,12 +348,12 @@ class PDBList:
             return super().__new__(cls)
 
     def __init__(self, pdb_names):
-        valid_pdb_names = filter(
+        self.set = {
+            PDBIDFactory(name)
+            for name in pdb_names
             # str() because may receive Paths
-            lambda x: not str(x).startswith('#'),
-            pdb_names,
-            )
-        self.set = set(PDBIDFactory(element) for element in valid_pdb_names)
+            if not str(name).startswith('#')
+            }
 
     def __repr__(self):
         return '{}(\n    {})\n'.format(
@@ -374,7 +401,12 @@ class PDBList:
 
     def to_tuple(self):
         """Convert PDBList to sorted tuple."""
-        return tuple(sorted(self.set))
+        # .set is never mutated after __init__, sort it only once
+        try:
+            return self._sorted
+        except AttributeError:
+            self._sorted = tuple(sorted(self.set))
+            return self._sorted
 
     def difference(self, other):
         """
@@ -430,6 +462,8 @@ class PDBID:
         The chain identifier.
     """
 
+    __slots__ = ('name', 'chain', 'identifiers')
+
     # segment are fragments of the same chain
     def __init__(self, name, chain=None, segment=None):
 
@@ -6,6 +6,7 @@ Classes
 Structure
     The main API that represents a protein structure in IDPConfGen.
 """
+import io
 import traceback
 import warnings
 from collections import defaultdict
@@ -68,6 +69,7 @@ class Structure:
     """
 
     __slots__ = [
+        '_clash_cache',
         '_data_array',
         '_datastr',
         '_filters',
@@ -123,17 +125,31 @@ class Structure:
         """
         Filter data array by the selected filters.
 
+        Filters registered through the specialized ``add_filter_*``
+        methods apply as vectorized boolean masks; generic callables
+        registered with :meth:`add_filter` evaluate row by row.
+
         Returns
         -------
-        list
+        np.ndarray
             The data in PDB format after filtering.
         """
-        apply_filter = _APPLY_FILTER
-        return np.array(list(reduce(
-            apply_filter,
-            self.filters,
-            self.data_array,
-            )))
+        da = self.data_array
+        for func in self.filters:
+            if da.shape[0] == 0:
+                break
+            if getattr(func, 'vectorized', False):
+                da = da[func(da)]
+            else:
+                mask = np.fromiter(
+                    (bool(func(row)) for row in da),
+                    dtype=bool,
+                    count=da.shape[0],
+                    )
+                da = da[mask]
+        # a copy, so that downstream edits (e.g. atom renumbering)
+        # do not write back into `data_array`
+        return np.array(da)
 
     @property
     def chain_set(self):
@@ -207,20 +223,35 @@ class Structure:
 
     def add_filter_record_name(self, record_name):
         """Add filter for record names."""
-        self.filters.append(
-            lambda x: x[col_record].startswith(record_name)
-            )
+        def record_name_filter(da):
+            col = da[:, col_record]
+            if isinstance(record_name, str):
+                return np.char.startswith(col, record_name)
+            return np.logical_or.reduce(
+                [np.char.startswith(col, rn) for rn in record_name]
+                )
+        record_name_filter.vectorized = True
+        self.filters.append(record_name_filter)
 
     def add_filter_chain(self, chain):
         """Add filters for chain."""
-        self.filters.append(lambda x: x[col_chainID] == chain)
+        def chain_filter(da):
+            return da[:, col_chainID] == chain
+        chain_filter.vectorized = True
+        self.filters.append(chain_filter)
 
     def add_filter_backbone(self, minimal=False):
         """Add filter to consider only backbone atoms."""
-        ib = is_backbone
-        self.filters.append(
-            lambda x: ib(x[col_name], x[col_element], minimal=minimal)
-            )
+        # mirrors `is_backbone`, applied to whole columns at once
+        elements = ('N', 'C') if minimal else ('N', 'C', 'O')
+
+        def backbone_filter(da):
+            return np.logical_and(
+                np.isin(np.char.strip(da[:, col_name]), ('N', 'CA', 'C', 'O')),
+                np.isin(np.char.strip(da[:, col_element]), elements),
+                )
+        backbone_filter.vectorized = True
+        self.filters.append(backbone_filter)
 
     def get_PDB(self, pdb_filters=None, renumber=True):
         """
@@ -237,17 +268,13 @@ class Structure:
 
         fs = self.filtered_atoms
 
+        if fs.shape[0] == 0:
+            errmsg = 'There are no lines in selection.'
+            raise EmptyFilterError(errmsg)
+
         # renumber atoms
         if renumber:
-            try:
-                fs[:, col_serial] = np.arange(1, fs.shape[0] + 1).astype('<U8')
-            except IndexError as err:
-                errmsg = (
-                    'Could not renumber atoms, most likely, because '
-                    'there are no lines in selection.'
-                    )
-                err2 = EmptyFilterError(errmsg)
-                raise err2 from err
+            fs[:, col_serial] = np.arange(1, fs.shape[0] + 1).astype('<U8')
 
         pdb_filters = pdb_filters or []
 
@@ -334,10 +361,10 @@ def parse_pdb_to_array(datastr, which='both'):
     if model_idx and endmdl_idx:
         start = model_idx.span()[1]
         end = endmdl_idx.span()[0] - 1
-        lines = datastr[start: end].split('\n')
+        datastr = datastr[start: end]
 
-    else:
-        lines = datastr.split('\n')
+    # lazy line split, only the record lines are ever materialized
+    lines = (line.rstrip('\n') for line in io.StringIO(datastr))
 
     record_lines = filter_record_lines(lines, which=which)
     data_array = gen_empty_structure_data_array(len(record_lines))
@@ -352,11 +379,11 @@ def parse_cif_to_array(datastr, **kwargs):
     Array is as given by :func:`gen_empty_structure_data_array`.
     """
     cif = CIFParser(datastr, **kwargs)
-    number_of_atoms = len(cif)
-    data_array = gen_empty_structure_data_array(number_of_atoms)
+    data_array = gen_empty_structure_data_array(len(cif))
 
-    for ii in range(number_of_atoms):
-        data_array[ii, :] = cif.get_line_elements_for_PDB(line=ii)
+    # one assignment per column (SoA) instead of one parser call per atom
+    for col, values in enumerate(cif.get_columns_for_PDB()):
+        data_array[:, col] = values
 
     return data_array
 
@@ -507,19 +534,37 @@ def populate_structure_array_from_pdb(record_lines, data_array):
         Populates array in place.
     """
     AS = libpdb.atom_slicers
-    for row, line in enumerate(record_lines):
-        for column, slicer_item in enumerate(AS):
-            data_array[row, column] = line[slicer_item].strip()
+
+    # the fixed-width lines are viewed as one (N, 80) byte matrix and
+    # each column is sliced out with a single C-level operation,
+    # instead of performing N x len(AS) Python-level slices
+    try:
+        buf = ''.join(
+            line.ljust(80)[:80] for line in record_lines
+            ).encode('ascii')
+    except UnicodeEncodeError:
+        # non-ASCII content is out of PDB spec; parse it cell by cell
+        for row, line in enumerate(record_lines):
+            for column, slicer_item in enumerate(AS):
+                data_array[row, column] = line[slicer_item].strip()
+        return
+
+    chars = np.frombuffer(buf, dtype='S1').reshape(len(record_lines), 80)
+    for column, slicer_item in enumerate(AS):
+        width = slicer_item.stop - slicer_item.start
+        col = np.ascontiguousarray(chars[:, slicer_item])
+        col = col.view(f'S{width}').ravel()
+        data_array[:, column] = np.char.strip(col.astype('<U8'))
 
 
 def filter_record_lines(lines, which='both'):
     """Filter lines to get record lines only."""
-    RH = record_line_headings
     try:
-        return [line for line in lines if line.startswith(RH[which])]
+        prefix = record_line_headings[which]
     except KeyError as err:
         err2 = ValueError(f'`which` got an unexpected value \'{which}\'.')
         raise err2 from err
+    return [line for line in lines if line.startswith(prefix)]
 
 
 def get_datastr(data):
@@ -578,12 +623,15 @@ def write_PDB(lines, filename):
     filename : str or Path
         The name of the output PDB file.
     """
-    # use join here because lines can be a generator
-    concat_lines = '\n'.join(lines)
-    if concat_lines:
-        with open(filename, 'w') as fh:
-            fh.write(concat_lines)
-            fh.write('\n')
+    # accumulate bytes as lines arrive, lines can be a generator
+    buf = bytearray()
+    buf_extend = buf.extend
+    for line in lines:
+        buf_extend(line.encode('ascii'))
+        buf_extend(b'\n')
+    if buf:
+        with open(filename, 'wb') as fh:
+            fh.write(buf)
     else:
         warnings.warn('Empty lines, nothing to write, ignoring.', UserWarning)  # noqa: E501 B028
 
@@ -601,13 +649,48 @@ def structure_to_pdb(atoms):
     ------
     Formatted PDB line according to `libpdb.atom_line_formatter`.
     """
-    for line in atoms:
-        values = [func(i) for i, func in zip(line, libpdb.atom_format_funcs)]
-        values[col_name] = libpdb.format_atom_name(
-            values[col_name],
-            values[col_element],
-            )
-        yield libpdb.atom_line_formatter.format(*values)
+    atoms = np.asarray(atoms)
+    if atoms.shape[0] == 0:
+        return
+
+    names = atoms[:, col_name]
+    elements = atoms[:, col_element]
+
+    # `format_atom_name` depends only on the (name, element) pair;
+    # format each unique pair once and gather over the whole column
+    pairs = np.char.add(np.char.add(names, '|'), elements)
+    _, first, inverse = np.unique(
+        pairs,
+        return_index=True,
+        return_inverse=True,
+        )
+    formatted_names = np.asarray(
+        [libpdb.format_atom_name(names[i], elements[i]) for i in first],
+        )[inverse]
+
+    # each entry mirrors one field of `libpdb.atom_line_formatter`,
+    # computed as a single C-level operation per column
+    char = np.char
+    parts = [
+        char.ljust(atoms[:, col_record], 6),
+        char.mod('%5d ', atoms[:, col_serial].astype(int)),
+        formatted_names,
+        char.ljust(atoms[:, col_altLoc], 1),
+        char.add(char.ljust(atoms[:, col_resName], 3), ' '),
+        char.ljust(char.strip(atoms[:, col_chainID]).astype('<U1'), 1),
+        char.mod('%4d', atoms[:, col_resSeq].astype(int)),
+        char.add(char.ljust(atoms[:, col_iCode], 1), '   '),
+        char.mod('%8.3f', atoms[:, col_x].astype(float)),
+        char.mod('%8.3f', atoms[:, col_y].astype(float)),
+        char.mod('%8.3f', atoms[:, col_z].astype(float)),
+        char.mod('%6.2f', atoms[:, col_occ].astype(float)),
+        char.add(char.mod('%6.2f', atoms[:, col_temp].astype(float)), '      '),  # noqa: E501
+        char.ljust(atoms[:, col_segid], 4),
+        char.rjust(elements, 2),
+        char.ljust(atoms[:, col_model], 2),
+        ]
+
+    yield from reduce(np.char.add, parts).tolist()
 
 
 col_record = 0
@@ -649,10 +732,6 @@ structure_parsers = [
     ]
 
 
-def _APPLY_FILTER(it, func):
-    return filter(func, it)
-
-
 def is_backbone(atom, element, minimal=False):
     """
     Whether `atom` is a protein backbone atom or not.
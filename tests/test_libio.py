@@ -295,6 +295,32 @@ def test_save_pairs_to_tar(func):
                     assert data == txt.decode()
 
 
+def test_pair_saver_tar_batches():
+    """Save successive batches to a single tar through PairSaver."""
+    df = 'saved_pairs_batches.tar'
+    batch1 = [('pair1.txt', 'some data')]
+    batch2 = [('pair2.txt', b'other data')]
+    with tcommons.TmpFile(df):
+        with libio.PairSaver(df) as saver:
+            saver.save(batch1)
+            saver.save(batch2)
+        with tarfile.open(df, 'r') as tin:
+            names = tin.getnames()
+            assert sorted(names) == ['pair1.txt', 'pair2.txt']
+            assert tin.extractfile('pair1.txt').read() == b'some data'
+            assert tin.extractfile('pair2.txt').read() == b'other data'
+
+
+def test_pair_saver_folder():
+    """Save pairs to a folder through PairSaver."""
+    df = 'pair_saver_folder'
+    pairs = [('pair1.txt', 'some data')]
+    with tcommons.TmpFolder(df):
+        with libio.PairSaver(df) as saver:
+            saver.save(pairs)
+        assert Path(df, 'pair1.txt').read_text() == 'some data'
+
+
 def test_paths_from_flist():
     """Test paths from list."""
     result = libio.paths_from_flist(tcommons.iofiles_folder / 'file.list')